@@ -9,15 +9,16 @@ Movesense IMU dashboard (Tkinter + embedded Matplotlib)
 - Data recording / saving / importing
 - X-axis in seconds under each graph
 - Load/Unload CSV data
-- Smooth plotting using NumPy buffers and throttled redraw
+- Smooth plotting using NumPy buffers and blitted redraws
 """
 
 import asyncio
-import threading
+import logging
 import queue
+import sys
+import threading
 import time
 import struct
-import csv
 import numpy as np
 from typing import Optional
 
@@ -28,6 +29,13 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from bleak import BleakScanner, BleakClient
 
+try:
+    from numba import njit
+except ImportError:  # optional: packet parsing falls back to plain NumPy
+    njit = None
+
+log = logging.getLogger(__name__)
+
 # -----------------------
 # Config / UUIDs
 # -----------------------
@@ -42,29 +50,139 @@ PACKET_TYPE_DATA = 2
 PACKET_TYPE_DATA_PART2 = 3
 
 BUFFER_LEN = 500  # number of points per plot window
-POLL_INTERVAL_MS = 30  # GUI update interval (ms)
+REDRAW_INTERVAL_MS = 60  # minimum spacing of live plot redraws (ms)
+HEARTBEAT_MS = 250  # status/timer refresh interval (ms)
+AUTOSCALE_EVERY = 15  # live frames between full redraws that refit the axes
 
 SAMPLE_RATE_HZ = 104
 SAMPLE_INTERVAL = 1.0 / SAMPLE_RATE_HZ
+WINDOW_S = BUFFER_LEN * SAMPLE_INTERVAL  # live plot window length (s)
+
+LIVE_XLABEL = "Time since window start (s)"
+LOADED_XLABEL = "Time (s)"
 
-data_queue = queue.Queue(maxsize=5000)
+SAMPLES_PER_PACKET = 8  # IMU9 samples per notification pair
+IMU9_OFFSET = 6  # payload starts after type, ref and uint32 timestamp
+RING_PACKETS = 1024  # IMU9 packets buffered between the BLE thread and the GUI
+
+CSV_HEADER = ["Time","ax","ay","az","gx","gy","gz","mx","my","mz"]
+REC_INITIAL_ROWS = 16384  # recording buffer rows; doubled when full
 
 ble_loop: Optional[asyncio.AbstractEventLoop] = None
 ble_thread: Optional[threading.Thread] = None
+ble_cmds: Optional[asyncio.Queue] = None
 ble_client: Optional[BleakClient] = None
 ble_client_lock = threading.Lock()
+ble_write_response = True  # False once the command char allows write-without-response
 ble_connected = threading.Event()
 streaming_flag = threading.Event()
 
 # -----------------------
-# DataView helper
+# Packet ring shared with the BLE thread
+# -----------------------
+class PacketRing:
+    """Preallocated ring of IMU9 packets: a uint32 base timestamp plus an
+    (8, 9) float32 block of ax..mz rows.
+
+    The BLE callback pushes one packet by slot assignment and the GUI pops
+    everything written since its last call. head/tail are running packet
+    counts; the lock only guards the short copy and counter update.
+    The first push after a pop sets `pending` and calls `on_data` once, so
+    the consumer is woken per batch rather than polling.
+    """
+    def __init__(self, capacity, samples=SAMPLES_PER_PACKET, width=9):
+        self.capacity = capacity
+        self.ts = np.empty(capacity, dtype=np.uint32)
+        self.buf = np.empty((capacity, samples, width), dtype=np.float32)
+        self.head = 0
+        self.tail = 0
+        self.lock = threading.Lock()
+        self.pending = threading.Event()
+        self.on_data = None
+
+    def push(self, timestamp, block):
+        with self.lock:
+            if self.head - self.tail >= self.capacity:
+                return False  # GUI fell behind: drop the packet
+            i = self.head % self.capacity
+            self.ts[i] = timestamp
+            self.buf[i] = block
+            self.head += 1
+        if not self.pending.is_set():
+            self.pending.set()
+            if self.on_data:
+                self.on_data()
+        return True
+
+    def pop_all(self):
+        """Return (base timestamps, blocks) of all packets since the last pop."""
+        with self.lock:
+            self.pending.clear()
+            n = self.head - self.tail
+            i = self.tail % self.capacity
+            if i + n <= self.capacity:
+                ts, blocks = self.ts[i:i+n].copy(), self.buf[i:i+n].copy()
+            else:
+                wrap = i + n - self.capacity
+                ts = np.concatenate((self.ts[i:], self.ts[:wrap]))
+                blocks = np.concatenate((self.buf[i:], self.buf[:wrap]))
+            self.tail = self.head
+        return ts, blocks
+
+data_ring = PacketRing(RING_PACKETS)
+
+# -----------------------
+# IMU9 packet parsing
+# -----------------------
+# `flat` is the 72-float payload: 8 acc, then 8 gyro, then 8 mag XYZ
+# triplets. `out` receives one ax..mz row per sample.
+if njit:
+    @njit(cache=True)
+    def _pack_imu9(flat, out):
+        n = out.shape[0]
+        for i in range(n):
+            for g in range(3):
+                for c in range(3):
+                    out[i, 3*g + c] = flat[g*3*n + 3*i + c]
+else:
+    def _pack_imu9(flat, out):
+        n = out.shape[0]
+        out[:] = flat.reshape(3, n, 3).transpose(1, 0, 2).reshape(n, 9)
+
+# Compile (or load from cache) now rather than inside the first BLE callback.
+# The callback passes a read-only np.frombuffer view over bytes, so warm up
+# with the same kind of array or Numba would specialise again on first use.
+_pack_imu9(np.frombuffer(bytes(SAMPLES_PER_PACKET * 9 * 4), dtype="<f4"),
+           np.empty((SAMPLES_PER_PACKET, 9), dtype=np.float32))
+
+# -----------------------
+# Plot decimation
 # -----------------------
-class DataView:
-    def __init__(self, arr):
-        self.arr = arr
-    def get_uint_8(self, i): return self.arr[i]
-    def get_uint_32(self, i): return struct.unpack_from("<I", bytes(self.arr[i:i+4]))[0]
-    def get_float_32(self, i): return struct.unpack_from("<f", bytes(self.arr[i:i+4]))[0]
+def minmax_decimate(x, y, bins):
+    """Reduce (x, y) to the min and max sample of each of `bins` bins.
+
+    Keeps every visible peak while drawing at most ~2 points per pixel
+    column. Inputs short enough already are returned unchanged.
+    """
+    n = len(y)
+    if bins <= 0 or n <= 2 * bins:
+        return x, y
+    per = n // bins
+    m = per * bins
+    xb = x[:m].reshape(bins, per)
+    yb = y[:m].reshape(bins, per)
+    imin = yb.argmin(axis=1)
+    imax = yb.argmax(axis=1)
+    # Emit each bin's pair in sample order so x stays monotonic
+    first = np.minimum(imin, imax)
+    second = np.maximum(imin, imax)
+    rows = np.arange(bins)
+    xs = np.column_stack((xb[rows, first], xb[rows, second])).ravel()
+    ys = np.column_stack((yb[rows, first], yb[rows, second])).ravel()
+    if m < n:
+        xs = np.concatenate((xs, x[m:]))
+        ys = np.concatenate((ys, y[m:]))
+    return xs, ys
 
 # -----------------------
 # BLE event loop utilities
@@ -73,17 +191,57 @@ def start_ble_event_loop_thread():
     global ble_loop, ble_thread
     if ble_thread and ble_thread.is_alive():
         return
+    ready = threading.Event()
     def _run_loop(loop):
+        global ble_cmds
         asyncio.set_event_loop(loop)
+        ble_cmds = asyncio.Queue()
+        loop.create_task(_cmd_pump(ble_cmds))
+        ready.set()
         loop.run_forever()
-    ble_loop = asyncio.new_event_loop()
+    # uvloop (Linux/macOS only, optional) cuts per-callback dispatch cost;
+    # only the BLE loop uses it, the process-wide policy is left alone
+    ble_loop = None
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            ble_loop = uvloop.new_event_loop()
+        except ImportError:
+            pass
+    if ble_loop is None:
+        ble_loop = asyncio.new_event_loop()
+    # Keep asyncio's debug bookkeeping off the notification hot path
+    ble_loop.set_debug(False)
+    ble_loop.slow_callback_duration = 10.0
     ble_thread = threading.Thread(target=_run_loop, args=(ble_loop,), daemon=True)
     ble_thread.start()
-
-def run_coro_threadsafe(coro):
+    ready.wait()
+
+async def _cmd_pump(cmds):
+    """Run GUI-issued BLE commands one at a time, in submission order."""
+    while True:
+        coro, on_done = await cmds.get()
+        # Run the command as its own task so that whatever it ends with,
+        # including CancelledError, is handed to on_done instead of killing
+        # the pump; only cancelling the pump itself leaves this loop
+        task = asyncio.ensure_future(coro)
+        await asyncio.wait((task,))
+        if task.cancelled():
+            result = asyncio.CancelledError()
+        elif task.exception() is not None:
+            result = task.exception()
+        else:
+            result = task.result()
+        if on_done:
+            try: on_done(result)
+            except Exception: log.exception("BLE command callback failed")
+
+def send_command(coro, on_done=None):
+    """Queue coro for the command pump; on_done(result) runs on the BLE
+    thread with the coroutine's return value or the exception it raised."""
     if not ble_loop:
         raise RuntimeError("BLE loop not started")
-    return asyncio.run_coroutine_threadsafe(coro, ble_loop)
+    ble_loop.call_soon_threadsafe(ble_cmds.put_nowait, (coro, on_done))
 
 # -----------------------
 # BLE coroutines
@@ -96,7 +254,7 @@ async def _scan_find_movesense(timeout=5.0):
     return None
 
 async def _connect_and_prepare():
-    global ble_client
+    global ble_client, ble_write_response
     dev = await _scan_find_movesense()
     if not dev:
         return False, "No Movesense found"
@@ -107,6 +265,11 @@ async def _connect_and_prepare():
         return False, f"Connect failed: {e}"
     if not client.is_connected:
         return False, "Connect failed"
+    # Start/stop are fire-and-forget, so skip the ATT write response when the
+    # firmware advertises write-without-response. The MTU needs no request
+    # here: BlueZ, WinRT and CoreBluetooth negotiate it during connect.
+    char = client.services.get_characteristic(WRITE_CHAR)
+    ble_write_response = not (char and "write-without-response" in char.properties)
     with ble_client_lock:
         ble_client = client
     return True, f"Connected: {dev.name}"
@@ -116,42 +279,29 @@ async def _start_streaming():
     if not ble_client:
         return False, "Not connected"
     ongoing = {"part": None}
+    block = np.empty((SAMPLES_PER_PACKET, 9), dtype=np.float32)
 
     def _handle_notify(sender, data: bytearray):
         try:
-            d = DataView(data)
-            ptype = d.get_uint_8(0)
+            ptype = data[0]
             if ptype == PACKET_TYPE_DATA:
                 ongoing["part"] = bytes(data)
             elif ptype == PACKET_TYPE_DATA_PART2:
                 if ongoing["part"] is None:
                     return
-                combined = bytearray(ongoing["part"]) + bytearray(data[2:])
-                dv = DataView(combined)
-                timestamp = dv.get_uint_32(2)
-                for i in range(8):
-                    offset = 6 + i * 3 * 4
-                    skip = 3 * 8 * 4
-                    ax = dv.get_float_32(offset)
-                    ay = dv.get_float_32(offset+4)
-                    az = dv.get_float_32(offset+8)
-                    gx = dv.get_float_32(offset+skip+0)
-                    gy = dv.get_float_32(offset+skip+4)
-                    gz = dv.get_float_32(offset+skip+8)
-                    mx = dv.get_float_32(offset+2*skip+0)
-                    my = dv.get_float_32(offset+2*skip+4)
-                    mz = dv.get_float_32(offset+2*skip+8)
-                    try:
-                        data_queue.put_nowait((timestamp + i, ax, ay, az, gx, gy, gz, mx, my, mz))
-                    except queue.Full:
-                        pass
+                # Index and unpack straight from the buffers; no slice copies
+                combined = ongoing["part"] + memoryview(data)[2:]
+                timestamp = struct.unpack_from("<I", combined, 2)[0]
+                flat = np.frombuffer(combined, dtype="<f4", count=SAMPLES_PER_PACKET * 9, offset=IMU9_OFFSET)
+                _pack_imu9(flat, block)
+                data_ring.push(timestamp, block)
                 ongoing["part"] = None
         except Exception:
             return
 
     try:
         await ble_client.start_notify(NOTIFY_CHAR, _handle_notify)
-        await ble_client.write_gatt_char(WRITE_CHAR, CMD_START_IMU9, response=True)
+        await ble_client.write_gatt_char(WRITE_CHAR, CMD_START_IMU9, response=ble_write_response)
     except Exception as e:
         return False, f"Start failed: {e}"
     streaming_flag.set()
@@ -162,7 +312,7 @@ async def _stop_streaming():
     if not ble_client:
         return False, "Not connected"
     try:
-        await ble_client.write_gatt_char(WRITE_CHAR, CMD_STOP_IMU9, response=True)
+        await ble_client.write_gatt_char(WRITE_CHAR, CMD_STOP_IMU9, response=ble_write_response)
         await ble_client.stop_notify(NOTIFY_CHAR)
     except Exception:
         pass
@@ -226,7 +376,10 @@ class MovesenseApp:
         self.timer_label.pack(side="right", padx=6)
         self.recording = False
         self.record_start_time = None
-        self.recorded_data = []
+        # Recorded rows go into a growable array; float64 keeps the time
+        # column exact for large sensor timestamps
+        self._rec = np.empty((REC_INITIAL_ROWS, len(CSV_HEADER)))
+        self._rec_n = 0
 
         # Figure and lines
         self.fig, self.axs = plt.subplots(3,1,figsize=(8,6))
@@ -234,33 +387,62 @@ class MovesenseApp:
         self.canvas = FigureCanvasTkAgg(self.fig, master=root)
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
-        # Use NumPy buffers
-        self.buff_time = np.zeros(BUFFER_LEN)
-        self.buff_ax = np.zeros((BUFFER_LEN,3))
-        self.buff_gyro = np.zeros((BUFFER_LEN,3))
-        self.buff_mag = np.zeros((BUFFER_LEN,3))
-        self.ptr = 0
+        # Use NumPy buffers. Each sample is written twice, at ptr and
+        # ptr+BUFFER_LEN, so the latest window is always the contiguous
+        # slice [ptr:ptr+BUFFER_LEN] and never needs a wrap-around gather.
+        # Live x values are fixed offsets into the window, so once it is full
+        # only the y data changes per frame
+        self.window_x = np.arange(BUFFER_LEN, dtype=np.float32) * np.float32(SAMPLE_INTERVAL)
+        self.buff_ax = np.zeros((2*BUFFER_LEN,3), dtype=np.float32)
+        self.buff_gyro = np.zeros((2*BUFFER_LEN,3), dtype=np.float32)
+        self.buff_mag = np.zeros((2*BUFFER_LEN,3), dtype=np.float32)
+        self.ptr = 0  # next write position == oldest sample in the window
         self.count = 0  # total points received
 
         self.lines = []
+        self.line_groups = []
         for ax, labels in zip(self.axs,[['Acc X','Acc Y','Acc Z'],['Gyro X','Gyro Y','Gyro Z'],['Mag X','Mag Y','Mag Z']]):
+            group = []
             for label in labels:
-                line, = ax.plot([], [], label=label)
-                self.lines.append(line)
+                line, = ax.plot([], [], label=label, animated=True)
+                group.append(line)
+            self.lines.extend(group)
+            self.line_groups.append(group)
             ax.legend(loc='center left', bbox_to_anchor=(1.02, 0.5))
-            ax.set_xlabel("Time (s)")
+            ax.set_xlabel(LIVE_XLABEL)
         self.axs[0].set_title("Accelerometer")
         self.axs[1].set_title("Gyroscope")
         self.axs[2].set_title("Magnetometer")
 
+        # Blitting: lines are animated artists, so full draws only paint the
+        # axes chrome. Every full draw recaches that per axis and then draws
+        # the lines on top; live frames only restore + redraw the lines
+        self._bgs = None
+        self._frame = 0
+        self._px_budget = None  # axes width in pixels, reset on resize
+        self._x_fixed = False  # lines already hold window_x as their x data
+        self._dirty = False  # buffers changed since the last live redraw
+        self._redraw_id = None
+        self.canvas.mpl_connect("resize_event", self._on_resize)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
         # Slider
         self.slider = ttk.Scale(root, from_=0, to=0, orient="horizontal", command=self.slider_moved)
         self.slider.pack_forget()
         self.loaded_data = None
         self.loaded_times = None
 
-        self.root.after(POLL_INTERVAL_MS, self._poll_data_and_update_plot)
-        self.root.after(200, self._update_timer)
+        # BLE thread wakes the GUI through a virtual event instead of polling.
+        # With threaded Tcl, event_generate blocks its caller until the Tk
+        # thread runs it, so the BLE loop only sets an Event and a separate
+        # waker thread posts the event. BLE command results take the same
+        # route: the loop thread only queues them and sets the Event
+        self._wake = threading.Event()
+        self._replies = queue.SimpleQueue()
+        self.root.bind("<<BleData>>", self._on_ble_event)
+        data_ring.on_data = self._wake.set
+        threading.Thread(target=self._waker, daemon=True).start()
+        self.root.after(HEARTBEAT_MS, self._heartbeat)
 
     # -------------------
     # Status and timer
@@ -269,11 +451,15 @@ class MovesenseApp:
         self.status_var.set(text)
         self.status_label.config(foreground="green" if ok else "red")
 
-    def _update_timer(self):
+    def _heartbeat(self):
         if self.recording and self.record_start_time:
             elapsed = time.time() - self.record_start_time
             self.timer_var.set(f"{int(elapsed//60):02d}:{int(elapsed%60):02d}")
-        self.root.after(200, self._update_timer)
+        # Safety net in case a wake-up event was lost
+        self._run_replies()
+        if data_ring.pending.is_set():
+            self._drain()
+        self.root.after(HEARTBEAT_MS, self._heartbeat)
 
     # -------------------
     # Connect / Start / Stop / Disconnect / Exit
@@ -281,12 +467,11 @@ class MovesenseApp:
     def connect_clicked(self):
         self._set_status("Scanning...", ok=False)
         start_ble_event_loop_thread()
-        fut = run_coro_threadsafe(_connect_and_prepare())
-        def _on_done(f):
-            try:
-                ok,msg = f.result()
-            except Exception as e:
-                ok,msg = False,f"Connect exception: {e}"
+        def _on_done(result):
+            if isinstance(result, BaseException):
+                ok,msg = False,f"Connect exception: {result}"
+            else:
+                ok,msg = result
             if ok:
                 ble_connected.set()
                 self._set_status(msg, ok=True)
@@ -295,7 +480,7 @@ class MovesenseApp:
                 self.btn_connect.config(state="disabled")
             else:
                 self._set_status(msg, ok=False)
-        fut.add_done_callback(_on_done)
+        send_command(_connect_and_prepare(), self._on_main(_on_done))
 
     def start_clicked(self):
         if not ble_connected.is_set():
@@ -304,12 +489,11 @@ class MovesenseApp:
         if self.loaded_data is not None:
             self.unload_csv()
         self._set_status("Starting...", ok=False)
-        fut = run_coro_threadsafe(_start_streaming())
-        def _on_done(f):
-            try:
-                ok,msg = f.result()
-            except Exception as e:
-                ok,msg = False,f"Start exception: {e}"
+        def _on_done(result):
+            if isinstance(result, BaseException):
+                ok,msg = False,f"Start exception: {result}"
+            else:
+                ok,msg = result
             if ok:
                 streaming_flag.set()
                 self._set_status("Streaming", ok=True)
@@ -317,22 +501,19 @@ class MovesenseApp:
                 self.btn_stop.config(state="normal")
             else:
                 self._set_status(msg, ok=False)
-        fut.add_done_callback(_on_done)
+        send_command(_start_streaming(), self._on_main(_on_done))
 
     def stop_clicked(self):
         if not ble_connected.is_set():
             return
-        fut = run_coro_threadsafe(_stop_streaming())
-        def _on_done(f):
-            streaming_flag.clear()
-            self._set_status("Stopped", ok=False)
-            self.btn_start.config(state="normal")
-            self.btn_stop.config(state="disabled")
-        fut.add_done_callback(_on_done)
+        send_command(_stop_streaming())
+        streaming_flag.clear()
+        self._set_status("Stopped", ok=False)
+        self.btn_start.config(state="normal")
+        self.btn_stop.config(state="disabled")
 
     def disconnect_clicked(self):
-        fut = run_coro_threadsafe(_disconnect())
-        def _on_done(f):
+        def _on_done(result):
             ble_connected.clear()
             streaming_flag.clear()
             self._set_status("Disconnected", ok=False)
@@ -340,25 +521,38 @@ class MovesenseApp:
             self.btn_start.config(state="disabled")
             self.btn_stop.config(state="disabled")
             self.btn_disconnect.config(state="disabled")
-        fut.add_done_callback(_on_done)
+        send_command(_disconnect(), self._on_main(_on_done))
 
     def exit_clicked(self):
         self._set_status("Shutting down...", ok=False)
-        def _shutdown_and_close():
+        if not ble_loop:
+            self.root.quit()
+            return
+        # The pump runs these in order, so the loop stops only after the
+        # disconnect has finished; quit anyway if BLE does not respond
+        quit_on_main = self._on_main(lambda result: self.root.quit())
+        def _closed(result):
+            ble_loop.stop()
+            quit_on_main(result)
+        send_command(_stop_streaming())
+        send_command(_disconnect(), _closed)
+        self.root.after(4000, self.root.quit)
+
+    def _on_main(self, fn):
+        # Hop command results from the BLE thread back to the Tk thread
+        # without touching Tk from the loop (that would block it)
+        def _post(result):
+            self._replies.put((fn, result))
+            self._wake.set()
+        return _post
+
+    def _run_replies(self):
+        while True:
             try:
-                if ble_loop:
-                    fut1 = run_coro_threadsafe(_stop_streaming())
-                    try: fut1.result(timeout=2.0)
-                    except Exception: pass
-                    fut2 = run_coro_threadsafe(_disconnect())
-                    try: fut2.result(timeout=2.0)
-                    except Exception: pass
-                    try: ble_loop.call_soon_threadsafe(ble_loop.stop)
-                    except Exception: pass
-            finally:
-                try: self.root.after(0,self.root.quit)
-                except Exception: pass
-        threading.Thread(target=_shutdown_and_close, daemon=True).start()
+                fn, result = self._replies.get_nowait()
+            except queue.Empty:
+                return
+            fn(result)
 
     # -------------------
     # Record / Save / Load
@@ -367,7 +561,9 @@ class MovesenseApp:
         self.recording = not self.recording
         if self.recording:
             self.record_start_time = time.time()
-            self.recorded_data = []
+            # Drop any buffer a previous long recording doubled up
+            self._rec = np.empty((REC_INITIAL_ROWS, len(CSV_HEADER)))
+            self._rec_n = 0
             self.btn_record.config(text="Stop Record")
             self.btn_save.config(state="disabled")
         else:
@@ -375,40 +571,38 @@ class MovesenseApp:
             self.btn_save.config(state="normal")
 
     def save_csv(self):
-        if not self.recorded_data:
+        if not self._rec_n or self.recording:
             return
         fname = filedialog.asksaveasfilename(defaultextension=".csv")
         if fname:
-            with open(fname,"w",newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Time","ax","ay","az","gx","gy","gz","mx","my","mz"])
-                for row in self.recorded_data:
-                    writer.writerow(row)
+            # Time keeps full float64 precision; sensor columns are float32
+            np.savetxt(fname, self._rec[:self._rec_n], delimiter=",",
+                       fmt=["%.17g"] + ["%.9g"] * (len(CSV_HEADER) - 1),
+                       header=",".join(CSV_HEADER), comments="")
             messagebox.showinfo("Saved", f"Saved {fname}")
 
     def load_csv(self):
         fname = filedialog.askopenfilename(filetypes=[("CSV files","*.csv")])
         if fname:
-            times, data = [], []
-            with open(fname) as f:
-                reader = csv.reader(f)
-                headers = next(reader)
-                for i,row in enumerate(reader):
-                    times.append(i*SAMPLE_INTERVAL)
-                    data.append([float(x) for x in row[1:]])
-            self.loaded_times = times
-            self.loaded_data = data
-            self.slider.config(from_=0, to=max(0,len(times)-BUFFER_LEN))
+            data = np.loadtxt(fname, delimiter=",", skiprows=1, dtype=np.float32, ndmin=2)
+            self.loaded_times = np.arange(len(data), dtype=np.float32) * np.float32(SAMPLE_INTERVAL)
+            self.loaded_data = data[:, 1:]
+            self.slider.config(from_=0, to=max(0,len(data)-BUFFER_LEN))
             self.slider.pack(fill="x", padx=6, pady=6)
             self.slider.set(0)
+            self._bgs = None
+            self._set_xlabel(LOADED_XLABEL)
             self._update_plot_loaded(0)
 
     def unload_csv(self):
         self.loaded_data = None
+        self._bgs = None
         self.loaded_times = None
         self.slider.pack_forget()
+        self._set_xlabel(LIVE_XLABEL)
         for line in self.lines:
             line.set_data([],[])
+        self._x_fixed = False
         for ax in self.axs:
             ax.relim()
             ax.autoscale_view()
@@ -425,16 +619,13 @@ class MovesenseApp:
         end_idx = min(end_idx, len(self.loaded_data))
         if start_idx >= len(self.loaded_data):
             return
-        data_window = self.loaded_data[start_idx:end_idx]
-        times_window = self.loaded_times[start_idx:end_idx]
+        w = self.loaded_data[start_idx:end_idx]
+        t = self.loaded_times[start_idx:end_idx]
 
-        acc = [ [row[0],row[1],row[2]] for row in data_window ]
-        gyro = [ [row[3],row[4],row[5]] for row in data_window ]
-        mag = [ [row[6],row[7],row[8]] for row in data_window ]
-
-        for i,line_group in enumerate([acc,gyro,mag]):
-            for j in range(3):
-                self.lines[i*3+j].set_data(times_window,[row[j] for row in line_group])
+        bins = self._pixel_budget()
+        for j, line in enumerate(self.lines):
+            line.set_data(*minmax_decimate(t, w[:,j], bins))
+        self._x_fixed = False
         for ax in self.axs:
             ax.relim()
             ax.autoscale_view()
@@ -443,48 +634,132 @@ class MovesenseApp:
     # -------------------
     # Live plotting optimized
     # -------------------
-    def _poll_data_and_update_plot(self):
-        updated = False
-        while not data_queue.empty():
-            timestamp, axv, ayv, azv, gxv, gyv, gzv, mxv, myv, mzv = data_queue.get()
-            t_sec = timestamp * SAMPLE_INTERVAL
-
-            self.buff_time[self.ptr] = t_sec
-            self.buff_ax[self.ptr] = [axv, ayv, azv]
-            self.buff_gyro[self.ptr] = [gxv, gyv, gzv]
-            self.buff_mag[self.ptr] = [mxv, myv, mzv]
-            self.ptr = (self.ptr + 1) % BUFFER_LEN
-            self.count += 1
+    def _waker(self):
+        # May sit blocked behind a long canvas.draw(); only this thread waits
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            try:
+                self.root.event_generate("<<BleData>>", when="tail")
+            except Exception:
+                pass
+
+    def _on_ble_event(self, event=None):
+        self._run_replies()
+        self._drain()
+
+    def _drain(self):
+        # Only moves queued samples into the buffers; plotting is deferred to
+        # a throttled redraw so the BLE thread never waits behind Matplotlib
+        ts, blocks = data_ring.pop_all()
+        if len(ts):
+            block = blocks.reshape(-1, 9)
+            n = len(block)
+            # Only the newest BUFFER_LEN samples can be visible; write them in
+            # one fancy-indexed assignment per buffer
+            k = min(n, BUFFER_LEN)
+            idx = (self.ptr + n - k + np.arange(k)) % BUFFER_LEN
+
+            for i in (idx, idx + BUFFER_LEN):
+                self.buff_ax[i] = block[-k:, 0:3]
+                self.buff_gyro[i] = block[-k:, 3:6]
+                self.buff_mag[i] = block[-k:, 6:9]
+            self.ptr = (self.ptr + n) % BUFFER_LEN
+            self.count += n
 
             if self.recording:
-                self.recorded_data.append([t_sec, axv, ayv, azv, gxv, gyv, gzv, mxv, myv, mzv])
-
-            updated = True
-
-        if updated and self.loaded_data is None and self.count > 0:
-            # Compute slice for plotting
+                # Per-sample times are derived here, in bulk, rather than
+                # in the BLE callback
+                t_sec = (ts[:, None] + np.arange(SAMPLES_PER_PACKET, dtype=np.uint32)).ravel() * SAMPLE_INTERVAL
+                need = self._rec_n + n
+                if need > len(self._rec):
+                    grown = np.empty((max(2*len(self._rec), need), self._rec.shape[1]))
+                    grown[:self._rec_n] = self._rec[:self._rec_n]
+                    self._rec = grown
+                self._rec[self._rec_n:need, 0] = t_sec
+                self._rec[self._rec_n:need, 1:] = block
+                self._rec_n = need
+            self._dirty = True
+            if self._redraw_id is None:
+                self._redraw_id = self.root.after(REDRAW_INTERVAL_MS, self._redraw)
+
+    def _redraw(self):
+        self._redraw_id = None
+        if self._dirty and self.loaded_data is None and self.count > 0:
+            self._dirty = False
+            # Compute slice for plotting; both cases are views, not copies
             if self.count < BUFFER_LEN:
                 idxs = slice(0,self.count)
             else:
-                idxs = np.arange(self.ptr, self.ptr+BUFFER_LEN) % BUFFER_LEN
+                idxs = slice(self.ptr, self.ptr+BUFFER_LEN)
+
+            views = [self.buff_ax[idxs], self.buff_gyro[idxs], self.buff_mag[idxs]]
+            n = len(views[0])
+            x = self.window_x[:n]
+            bins = self._pixel_budget()
+            decimate = n > 2 * bins
+            full = n == BUFFER_LEN and not decimate
+            for group, values in zip(self.line_groups, views):
+                for i, line in enumerate(group):
+                    if decimate:
+                        line.set_data(*minmax_decimate(x, values[:,i], bins))
+                    elif full and self._x_fixed:
+                        line.set_ydata(values[:,i])
+                    else:
+                        line.set_data(x, values[:,i])
+            self._x_fixed = full
+
+            self._frame += 1
+            if (self._bgs is None or self._frame % AUTOSCALE_EVERY == 0
+                    or self._out_of_view(views)):
+                self._rescale_live(views)
+                self.canvas.draw()  # _on_draw recaches and draws the lines
+            else:
+                self._blit_lines()
+
+    def _out_of_view(self, views):
+        for ax, values in zip(self.axs, views):
+            lo, hi = ax.get_ylim()
+            if values.min() < lo or values.max() > hi:
+                return True
+        return False
+
+    def _rescale_live(self, views):
+        for ax, values in zip(self.axs, views):
+            ax.set_xlim(0, WINDOW_S)
+            lo, hi = float(values.min()), float(values.max())
+            pad = 0.1 * (hi - lo) or 1.0
+            ax.set_ylim(lo - pad, hi + pad)
+
+    def _set_xlabel(self, text):
+        for ax in self.axs:
+            ax.set_xlabel(text)
 
-            # Acc
-            for i in range(3):
-                self.lines[i].set_data(self.buff_time[idxs], self.buff_ax[idxs,i])
-            # Gyro
-            for i in range(3):
-                self.lines[3+i].set_data(self.buff_time[idxs], self.buff_gyro[idxs,i])
-            # Mag
-            for i in range(3):
-                self.lines[6+i].set_data(self.buff_time[idxs], self.buff_mag[idxs,i])
+    def _on_draw(self, event):
+        # The full draw blits the whole canvas itself once this returns
+        self._bgs = [self.canvas.copy_from_bbox(ax.bbox) for ax in self.axs]
+        self._draw_lines()
+
+    def _blit_lines(self):
+        for bg in self._bgs:
+            self.canvas.restore_region(bg)
+        self._draw_lines()
+        for ax in self.axs:
+            self.canvas.blit(ax.bbox)
 
-            for ax in self.axs:
-                ax.relim()
-                ax.autoscale_view()
+    def _draw_lines(self):
+        for ax, group in zip(self.axs, self.line_groups):
+            for line in group:
+                ax.draw_artist(line)
 
-            self.canvas.draw_idle()
+    def _pixel_budget(self):
+        if self._px_budget is None:
+            self._px_budget = max(1, int(self.axs[0].bbox.width))
+        return self._px_budget
 
-        self.root.after(POLL_INTERVAL_MS, self._poll_data_and_update_plot)
+    def _on_resize(self, event):
+        self._bgs = None
+        self._px_budget = None
 
 
 # -----------------------